@@ -56,7 +56,7 @@ def main():
     """)
     
     # Create tabs for different input methods and diagnosis
-    tab1, tab2, tab3, tab4 = st.tabs(["📄 Upload PDF", "🖼️ Upload Image (OCR)", "✏️ Enter Text", "🩺 Patient Info"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📄 Upload PDF", "🖼️ Upload Image (OCR)", "✏️ Enter Text", "🩺 Patient Info", "📚 Multiple Reports"])
     
     # Initialize variables to hold extracted and processed text
     if 'extracted_text' not in st.session_state:
@@ -202,6 +202,39 @@ def main():
             
             st.form_submit_button("Save Patient Information")
     
+    with tab5:
+        st.header("Multiple Reports")
+        st.markdown("Upload several reports for the same patient. Repeated history, medication lists and boilerplate are detected and summarized only once.")
+        uploaded_pdfs = st.file_uploader("Choose PDF files", type="pdf", accept_multiple_files=True, key="multi_pdf_uploader")
+        
+        if uploaded_pdfs:
+            if st.button("Generate Consolidated Summary", key="multi_summary_btn"):
+                with st.spinner("Extracting text and summarizing novel content..."):
+                    try:
+                        report_texts = []
+                        for pdf in uploaded_pdfs:
+                            text = extract_text_from_pdf_bytes(pdf.read())
+                            if text and text.strip():
+                                report_texts.append(preprocess_text(text))
+                            else:
+                                st.warning(f"No text could be extracted from {pdf.name}; skipping it.")
+                        if not report_texts:
+                            st.warning("No text could be extracted from any of the uploaded reports.")
+                        else:
+                            summary, stats = summarizer.summarize_reports(report_texts)
+                            st.caption(
+                                f"Kept {stats['kept_sections']}/{stats['total_sections']} sections "
+                                f"({stats['kept_words']}/{stats['total_words']} words) after removing repeated content."
+                            )
+                            if not summary:
+                                st.warning("All sections were duplicates of each other; there is no novel content to summarize.")
+                            else:
+                                st.subheader("📝 Consolidated Summary")
+                                st.write(summary)
+                                st.session_state.summary = summary
+                    except Exception as e:
+                        st.error(f"Error generating summary: {str(e)}")
+    
     # Process the extracted text if available
     if st.session_state.extracted_text and (('text_submitted' in st.session_state and st.session_state.text_submitted) or 'file_uploaded' in st.session_state):
         processed_text = preprocess_text(st.session_state.extracted_text)
@@ -0,0 +1,222 @@
+# Near-duplicate detection across multiple reports for the same patient
+
+import re
+import random
+import hashlib
+from typing import Dict, List, Set, Tuple
+
+# Mersenne prime used as the modulus for the MinHash permutations
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Lines with fewer words than this end a unit even without trailing punctuation
+_SHORT_LINE_WORDS = 8
+
+# Dates and page numbers change between every report and say nothing clinical
+_IGNORED_NUMBERS = re.compile(
+    r"\b\d{4}[-/.]\d{1,2}[-/.]\d{1,2}\b"
+    r"|\b\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4}\b"
+    r"|\bpage\s+\d+(?:\s+of\s+\d+)?\b",
+    re.IGNORECASE,
+)
+
+# Words whose presence or absence does not change the clinical meaning of a
+# section. Negations ("no", "not", "without", ...) are deliberately absent.
+_FILLER_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "of", "in", "on", "at", "to", "for", "with",
+    "by", "from", "as", "is", "was", "are", "were", "be", "been", "has", "had",
+    "have", "this", "that", "her", "his", "their", "she", "he", "they",
+})
+
+
+def _split_units(paragraph: str) -> List[str]:
+    """Splits a paragraph into sentence/line units.
+
+    PDF text wraps long sentences across lines, so a line break only ends a
+    unit when the line ends in punctuation or is short (a heading or a
+    "Field: value" line). Sentences within a line are split on ``.!?``.
+    """
+    units = []
+    current = []
+    for line in paragraph.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        current.append(line)
+        if re.search(r"[.!?:;]$", line) or len(line.split()) < _SHORT_LINE_WORDS:
+            units.append(" ".join(current))
+            current = []
+    if current:
+        units.append(" ".join(current))
+    return [u for unit in units for u in re.split(r"(?<=[.!?])\s+", unit) if u]
+
+
+def split_sections(text: str, min_words: int = 3, max_words: int = 60) -> List[str]:
+    """Splits a report into sections for fingerprinting.
+
+    Paragraphs (blank-line separated blocks) of up to ``max_words`` words are
+    kept whole; longer paragraphs, including a whole report that has no blank
+    lines at all, are split into sentence/line units so that a single changed
+    sentence does not make the rest of the paragraph look novel. Units shorter
+    than ``min_words`` (page numbers, stray headers) are merged into the
+    following unit so they are not fingerprinted on their own.
+    """
+    units = []
+    for block in re.split(r"\n\s*\n", text or ""):
+        block = block.strip()
+        if not block:
+            continue
+        if len(block.split()) <= max_words:
+            units.append(block)
+        else:
+            units.extend(_split_units(block))
+
+    sections = []
+    pending = ""
+    for unit in units:
+        unit = f"{pending}\n{unit}" if pending else unit
+        if len(unit.split()) < min_words:
+            pending = unit
+            continue
+        sections.append(unit)
+        pending = ""
+    if pending:
+        sections.append(pending)
+    return sections
+
+
+def _normalize(text: str) -> List[str]:
+    """Lowercases, drops punctuation and returns the word tokens."""
+    return re.sub(r"[^\w\s]", " ", text.lower()).split()
+
+
+def _content_tokens(text: str) -> Tuple[str, ...]:
+    """Returns the words and numbers that carry clinical content, in order (filler words dropped, negations kept)."""
+    return tuple(w for w in _normalize(text) if w not in _FILLER_WORDS)
+
+
+def shingles(text: str, k: int = 3) -> Set[str]:
+    """Returns the set of word k-shingles for a piece of text."""
+    words = _normalize(text)
+    if len(words) <= k:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+
+class NearDuplicateFilter:
+    def __init__(self, threshold: float = 0.7, num_perm: int = 128, bands: int = 32,
+                 shingle_size: int = 3, seed: int = 1):
+        """
+        MinHash/LSH index that remembers every section it has seen and flags
+        sections that are near-duplicates of an earlier one.
+
+        MinHash/LSH only finds candidate matches: a section is a duplicate when
+        it is similar to an earlier section *and* both contain the same words
+        and numbers in the same order, ignoring dates, page numbers, filler
+        words, case, punctuation and line breaks. A changed dose or frequency,
+        or a removed medication, in a section of any length therefore keeps
+        the section.
+
+        Args:
+            threshold (float): Estimated Jaccard similarity at or above which a
+                section counts as a duplicate
+            num_perm (int): Number of MinHash permutations
+            bands (int): Number of LSH bands (must divide num_perm)
+            shingle_size (int): Words per shingle
+            seed (int): Seed for the permutation coefficients
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        self._signatures: List[List[int]] = []
+        self._contents: List[Tuple[str, ...]] = []
+
+    def _signature(self, shingle_set: Set[str]) -> List[int]:
+        hashes = [
+            int.from_bytes(hashlib.sha1(s.encode("utf-8")).digest()[:4], "little")
+            for s in shingle_set
+        ]
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        ]
+
+    def _similarity(self, sig_a: List[int], sig_b: List[int]) -> float:
+        return sum(x == y for x, y in zip(sig_a, sig_b)) / self.num_perm
+
+    def is_duplicate(self, text: str) -> bool:
+        """
+        Checks a section against everything seen so far and indexes it if novel.
+
+        Args:
+            text (str): Section text
+
+        Returns:
+            bool: True if the section is a near-duplicate of an earlier one
+        """
+        # Dates and page numbers are not compared, so a section that differs
+        # only in them is a duplicate (and a bare page footer is dropped)
+        text = _IGNORED_NUMBERS.sub(" ", text)
+        shingle_set = shingles(text, self.shingle_size)
+        if not shingle_set:
+            return True
+
+        signature = self._signature(shingle_set)
+        contents = _content_tokens(text)
+        band_keys = [
+            tuple(signature[i * self.rows:(i + 1) * self.rows]) for i in range(self.bands)
+        ]
+
+        candidates = set()
+        for band, key in zip(self._buckets, band_keys):
+            candidates.update(band.get(key, ()))
+        for idx in candidates:
+            if (self._similarity(signature, self._signatures[idx]) >= self.threshold
+                    and contents == self._contents[idx]):
+                return True
+
+        idx = len(self._signatures)
+        self._signatures.append(signature)
+        self._contents.append(contents)
+        for band, key in zip(self._buckets, band_keys):
+            band.setdefault(key, []).append(idx)
+        return False
+
+
+def deduplicate_reports(texts: List[str], threshold: float = 0.7) -> Tuple[List[str], Dict]:
+    """Drops sections that repeat content from earlier reports (or earlier in the same report).
+
+    Args:
+        texts: Report texts for one patient, oldest first.
+        threshold: Estimated Jaccard similarity at or above which a section is dropped.
+
+    Returns:
+        A tuple of (novel_sections, stats) where stats counts total/kept sections and words.
+    """
+    dedup = NearDuplicateFilter(threshold=threshold)
+    novel = []
+    stats = {"total_sections": 0, "kept_sections": 0, "total_words": 0, "kept_words": 0}
+    for text in texts:
+        for section in split_sections(text):
+            words = len(section.split())
+            stats["total_sections"] += 1
+            stats["total_words"] += words
+            if dedup.is_duplicate(section):
+                continue
+            novel.append(section)
+            stats["kept_sections"] += 1
+            stats["kept_words"] += words
+    print(f"Deduplication kept {stats['kept_sections']}/{stats['total_sections']} sections "
+          f"({stats['kept_words']}/{stats['total_words']} words).")
+    return novel, stats
@@ -41,7 +41,9 @@ def extract_text_from_pdf_bytes(pdf_bytes):
         text = ""
         for page_num in range(len(doc)):
             page = doc.load_page(page_num)
-            text += page.get_text()
+            # Keep PyMuPDF's text blocks (paragraphs) and pages separated by blank lines
+            blocks = [b[4].strip() for b in page.get_text("blocks") if b[6] == 0 and b[4].strip()]
+            text += "\n\n".join(blocks) + "\n\n"
         doc.close()
         print(f"Successfully extracted text from PDF bytes.")
         return text
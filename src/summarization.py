@@ -1,8 +1,32 @@
 from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
+from transformers import LogitsProcessorList, MinNewTokensLengthLogitsProcessor
 import torch
+from typing import Dict, Optional, Tuple
+from src.deduplication import deduplicate_reports
 
 class MedicalSummarizer:
-    def __init__(self):
+    def __init__(self, draft_model_name: Optional[str] = None, num_beams: Optional[int] = None,
+                 early_stopping: Optional[bool] = None):
+        """
+        Initialize the summarization pipeline.
+        
+        Args:
+            draft_model_name (str, optional): Small model sharing BART's tokenizer
+                (e.g. 'sshleifer/distilbart-cnn-12-6') used for assisted decoding.
+                Assisted decoding is greedy, so num_beams must be 1 when it is used.
+            num_beams (int, optional): Beam count; None keeps the model's default
+            early_stopping (bool, optional): Beam early stopping; None keeps the model's
+                default. Must be left unset for greedy or assisted decoding (num_beams=1).
+        """
+        # Validate decoding options before loading any model
+        if draft_model_name:
+            if num_beams is None:
+                num_beams = 1
+            elif num_beams != 1:
+                raise ValueError("Assisted decoding only supports num_beams=1")
+        if num_beams == 1 and early_stopping is not None:
+            raise ValueError("early_stopping only applies to beam search (num_beams > 1)")
+        
         # Load pre-trained model and tokenizer
         self.model_name = "facebook/bart-large-cnn"  # Using BART model which works well for summarization
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -19,6 +43,48 @@ class MedicalSummarizer:
         self.max_length = 130
         self.min_length = 30
         self.do_sample = False
+        self.num_beams = num_beams
+        self.early_stopping = early_stopping
+        
+        # Optional draft model for assisted (speculative) decoding
+        self.draft_model_name = draft_model_name
+        self.assistant_model = None
+        if draft_model_name:
+            self.assistant_model = AutoModelForSeq2SeqLM.from_pretrained(draft_model_name).to(self.device)
+            self.assistant_model.eval()
+            # Distilled summarizers ship beam-search defaults; drafting must be greedy
+            self.assistant_model.generation_config.num_beams = 1
+            self.assistant_model.generation_config.early_stopping = False
+
+    def _generation_kwargs(self) -> dict:
+        """Build the keyword arguments passed through the pipeline to generate()"""
+        kwargs = {
+            "max_length": self.max_length,
+            "min_length": self.min_length,
+            "do_sample": self.do_sample,
+        }
+        if self.num_beams is not None:
+            kwargs["num_beams"] = self.num_beams
+        if self.early_stopping is not None:
+            kwargs["early_stopping"] = self.early_stopping
+        elif self.num_beams == 1:
+            # bart-large-cnn's generation config enables early stopping, which
+            # greedy decoding ignores and warns about on every call
+            kwargs["early_stopping"] = False
+        if self.assistant_model is not None:
+            kwargs["assistant_model"] = self.assistant_model
+            # Assisted generation rejects min_length (and min_new_tokens, which
+            # generate() converts into it), so enforce the same bound with an
+            # explicit processor; the decoder starts from a single start token
+            kwargs["min_length"] = 0
+            kwargs["logits_processor"] = LogitsProcessorList([
+                MinNewTokensLengthLogitsProcessor(
+                    prompt_length_to_skip=1,
+                    min_new_tokens=max(self.min_length - 1, 0),
+                    eos_token_id=self.summarizer.model.generation_config.eos_token_id
+                )
+            ])
+        return kwargs
 
     def summarize_text(self, text: str) -> str:
         """
@@ -32,19 +98,10 @@ class MedicalSummarizer:
         """
         try:
             # Split text into chunks if it's too long (BART has a max length of 1024 tokens)
-            chunks = self._chunk_text(text)
+            chunks = self.chunk_text(text)
             
             # Generate summary for each chunk and combine
-            summaries = []
-            for chunk in chunks:
-                summary = self.summarizer(
-                    chunk,
-                    max_length=self.max_length,
-                    min_length=self.min_length,
-                    do_sample=self.do_sample,
-                    truncation=True
-                )
-                summaries.append(summary[0]['summary_text'])
+            summaries = [self.summarize_chunk(chunk) for chunk in chunks]
             
             return " ".join(summaries)
             
@@ -52,7 +109,50 @@ class MedicalSummarizer:
             print(f"Error during summarization: {str(e)}")
             return "Error occurred during summarization"
     
-    def _chunk_text(self, text: str, max_chunk_size: int = 1000) -> list:
+    def summarize_chunk(self, chunk: str) -> str:
+        """
+        Summarize a single chunk with the configured decoding settings
+        
+        Unlike summarize_text, errors are raised rather than replaced by a
+        message, so callers such as benchmarks cannot mistake a failure for
+        a summary.
+        
+        Args:
+            chunk (str): Text short enough for the model (see chunk_text)
+            
+        Returns:
+            str: Summary of the chunk
+        """
+        summary = self.summarizer(
+            chunk,
+            truncation=True,
+            **self._generation_kwargs()
+        )
+        return summary[0]['summary_text']
+    
+    def summarize_reports(self, texts: list, threshold: float = 0.7) -> Tuple[str, Dict]:
+        """
+        Summarize several reports for the same patient into one summary
+        
+        Sections that near-duplicate earlier content (repeated history,
+        medication lists, boilerplate) are dropped before chunking, so only
+        novel material is passed to the model.
+        
+        Args:
+            texts (list): Report texts for one patient, oldest first
+            threshold (float): Estimated Jaccard similarity at or above which a
+                section is considered a duplicate
+            
+        Returns:
+            tuple: (consolidated summary, deduplication stats with total/kept
+                sections and words); the summary is empty if nothing is novel
+        """
+        novel_sections, stats = deduplicate_reports(texts, threshold=threshold)
+        if not novel_sections:
+            return "", stats
+        return self.summarize_text("\n\n".join(novel_sections)), stats
+    
+    def chunk_text(self, text: str, max_chunk_size: int = 1000) -> list:
         """
         Split text into chunks of approximately equal size
         """
@@ -79,5 +179,7 @@ class MedicalSummarizer:
         """Clean up resources"""
         if hasattr(self, 'summarizer'):
             del self.summarizer
+        if getattr(self, 'assistant_model', None) is not None:
+            del self.assistant_model
         if torch.cuda.is_available():
             torch.cuda.empty_cache()
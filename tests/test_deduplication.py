@@ -0,0 +1,102 @@
+import os
+
+from src.deduplication import deduplicate_reports, split_sections
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+HISTORY = (
+    "Past medical history: hypertension diagnosed in 2015, type 2 diabetes mellitus "
+    "diagnosed in 2018 and hyperlipidemia. Non-smoker with occasional alcohol use."
+)
+
+MEDICATIONS = (
+    "Current medications: furosemide 40 mg twice daily, bisoprolol 5 mg once daily, "
+    "sacubitril/valsartan 49/51 mg twice daily, spironolactone 25 mg once daily, "
+    "atorvastatin 40 mg at night, aspirin 75 mg once daily and metformin 500 mg "
+    "twice daily with paracetamol as required."
+)
+
+
+def kept(*reports):
+    novel, _ = deduplicate_reports(list(reports))
+    return novel
+
+
+def test_exact_repeat_is_dropped():
+    assert kept(HISTORY, HISTORY) == [HISTORY]
+
+
+def test_reflowed_repeat_is_dropped():
+    reflowed = HISTORY.replace(", ", ",\n").replace("2015", "2015 ")
+    assert kept(HISTORY, reflowed) == [HISTORY]
+
+
+def test_changed_dose_in_short_section_is_kept():
+    changed = "Atorvastatin 40 mg at night."
+    assert kept("Atorvastatin 20 mg at night.", changed)[-1] == changed
+
+
+def test_changed_lab_value_is_kept():
+    first = "HbA1c 7.4 percent, creatinine 1.6 mg/dL, potassium 4.9 mmol/L."
+    second = first.replace("7.4", "6.9")
+    assert kept(first, second)[-1] == second
+
+
+def test_changed_dose_in_long_section_is_kept():
+    assert len(MEDICATIONS.split()) > 40
+    changed = MEDICATIONS.replace("bisoprolol 5 mg", "bisoprolol 10 mg")
+    assert kept(MEDICATIONS, changed)[-1] == changed
+
+
+def test_changed_frequency_in_long_section_is_kept():
+    changed = MEDICATIONS.replace("bisoprolol 5 mg once daily", "bisoprolol 5 mg twice daily")
+    assert kept(MEDICATIONS, changed)[-1] == changed
+
+
+def test_swapped_frequencies_in_long_section_are_kept():
+    changed = MEDICATIONS.replace("bisoprolol 5 mg once daily", "bisoprolol 5 mg TWICE daily")
+    changed = changed.replace("furosemide 40 mg twice daily", "furosemide 40 mg once daily")
+    changed = changed.replace("TWICE", "twice")
+    assert kept(MEDICATIONS, changed)[-1] == changed
+
+
+def test_removed_medication_is_kept():
+    changed = MEDICATIONS.replace(" aspirin 75 mg once daily and", "")
+    assert kept(MEDICATIONS, changed)[-1] == changed
+
+
+def test_changed_date_or_page_number_alone_is_dropped():
+    first = f"Report date 2024-01-10\n\n{HISTORY}\n\nPage 1 of 2"
+    second = f"Report date 2024-03-07\n\n{HISTORY}\n\nPage 2 of 2"
+    assert kept(first, second) == kept(first)
+
+
+def test_report_without_blank_lines_is_split():
+    report = "\n".join([
+        "Patient Name: Jane Example",
+        "Past medical history: hypertension diagnosed in 2015, type 2 diabetes mellitus",
+        "diagnosed in 2018 and hyperlipidemia.",
+        "Current Medications:",
+        "Metformin 500 mg twice daily.",
+        "Lisinopril 10 mg once daily.",
+        "No known drug allergies. The patient is advised to continue a low salt diet and",
+        "regular exercise, and to monitor blood glucose at home twice daily.",
+        "Assessment: blood pressure 132/84 mmHg, HbA1c improved to 6.9 percent,",
+        "weight stable at 78 kg. Follow up in three months with repeat renal function.",
+    ])
+    assert "\n\n" not in report and len(report.split()) > 60
+    sections = split_sections(report)
+    assert len(sections) > 3
+    assert "Lisinopril 10 mg once daily." in sections
+
+
+def test_follow_up_report_keeps_changed_discharge_dose():
+    with open(os.path.join(DATA_DIR, "benchmark_report.txt"), encoding="utf-8") as f:
+        report = f.read()
+    old_line = "Furosemide 40 mg twice daily, bisoprolol"
+    assert old_line in report
+    follow_up = report.replace(old_line, "Furosemide 80 mg twice daily, bisoprolol")
+
+    novel = kept(report, follow_up)[len(kept(report)):]
+    assert len(novel) == 1
+    assert "Furosemide 80 mg twice daily" in novel[0]